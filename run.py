@@ -7,38 +7,63 @@
 # Configuration:
 #   export PT_CREDS_PATH="$HOME/.secrets/property-tracker-creds.json"
 #   export PT_SPREADSHEET_ID="1gdnnmodlkR8CzNAhXfKP90T_VBpnkSQVKvJ2ezjDOX8"
+#   # Optional: pin the first tab to skip the spreadsheet metadata request
+#   export PT_WORKSHEET_TITLE="Sheet1"
+#   export PT_WORKSHEET_GID="0"
 #
 # Notes:
 # - Do NOT commit credentials to Git.
-# - Opening by Spreadsheet ID avoids needing Google Drive API enabled.
+# - Opening by Spreadsheet ID (PT_SPREADSHEET_ID, recommended) avoids needing
+#   Google Drive API enabled and only requests the Sheets scope.
+# - OAuth access tokens and the parsed signing key are cached (owner-only) in
+#   ~/.cache/property-tracker/ between runs.
+# - If `orjson` is installed (optional), it is used to decode Sheets responses.
 
 # Import OS helpers for environment variables
+# Import atexit to close the session's text export handle on exit
+import atexit
+
 # Import CSV writer for exporting results
 import csv
 
+# Import functools to memoize the Google Sheets connection
+import functools
+
+# Import hashlib to fingerprint the service account key for the token cache
+import hashlib
+
 # Import JSON to read the service account email from the creds file (for helpful errors)
 import json
 import os
 
-# Import stats helpers
-import statistics
+# Import pickle to cache the parsed JWT signer between runs
+import pickle
+
+# Import sys to write batched terminal output in one call
+import sys
+
+# Import threading to connect to Google Sheets in the background
+import threading
+
+# Import namedtuple for the shared numeric statistics record
+from collections import namedtuple
+
+# Import a thread pool/futures to overlap independent blocking Sheets calls
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Import datetime to check when a cached OAuth token expires
+from datetime import datetime, timezone
 
 # Import Path to build safe file paths
 from pathlib import Path
 
-# Import gspread for Google Sheets access
-import gspread
-
-# Import NumPy for percentiles (quartiles / IQR)
+# Import NumPy for the summary statistics (mean, std dev, quartiles / IQR)
 import numpy as np
 
-# Import specific gspread exception so we can raise a clear message
-from gspread.exceptions import SpreadsheetNotFound
-
 # -------------------- Google Sheets connection --------------------
 
-# Default location for creds file (recommended: outside repo)
-DEFAULT_CREDS_PATH = Path.home() / ".secrets" / "property-tracker-creds.json"
+# Default location for creds file, under the home directory (recommended: outside repo)
+DEFAULT_CREDS_RELPATH = Path(".secrets", "property-tracker-creds.json")
 
 # Optional default spreadsheet ID for convenience (you can change/remove this later)
 DEFAULT_SPREADSHEET_ID = "1gdnnmodlkR8CzNAhXfKP90T_VBpnkSQVKvJ2ezjDOX8"
@@ -52,19 +77,226 @@ PLACEHOLDER_IDS = {
     "PASTE_THE_LONG_ID_HERE",
 }
 
+# Scopes requested for the service account; opening by ID never touches
+# Google Drive, so the broad Drive scope isn't requested
+SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
 
-def connect_to_google_sheet():
-    # Read creds path from environment variable or fall back to default
-    creds_path = Path(os.getenv("PT_CREDS_PATH", str(DEFAULT_CREDS_PATH))).expanduser()
+# Per-user cache directory (under the home directory) for data reused across runs
+CACHE_DIR_RELPATH = Path(".cache", "property-tracker")
 
-    # Fail fast if creds file does not exist
-    if not creds_path.exists():
+# Cached OAuth access token, reused across runs to skip the token endpoint
+TOKEN_CACHE_FILENAME = "token.json"
+
+# Cached JWT signer (parsed private key), reused across runs to skip PEM parsing
+SIGNER_CACHE_FILENAME = "signer.pkl"
+
+# Only reuse a cached token if it has more than this many seconds left
+TOKEN_EXPIRY_MARGIN_SECONDS = 60
+
+
+# Read creds path from PT_CREDS_PATH; the home directory lookup only
+# happens when falling back to the default
+def get_creds_path():
+    env_path = os.getenv("PT_CREDS_PATH")
+    if env_path:
+        return Path(env_path).expanduser()
+    return Path.home() / DEFAULT_CREDS_RELPATH
+
+
+def get_cache_dir():
+    return Path.home() / CACHE_DIR_RELPATH
+
+
+# google-auth works with naive UTC datetimes
+def _utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+# Fingerprint the key ID so a rotated service account key invalidates the cache
+def token_cache_key(private_key_id):
+    return hashlib.sha256(str(private_key_id).encode("utf-8")).hexdigest()
+
+
+# Return (token, expiry) from the cache if it matches this key and is still fresh
+def load_cached_token(cache_path, key_id, now=None):
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+
+        if cached.get("key_id") != key_id or cached.get("scopes") != SCOPES:
+            return None
+
+        token = cached["token"]
+        expiry = datetime.fromisoformat(cached["expiry_iso"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+    remaining = (expiry - (now or _utcnow())).total_seconds()
+    if remaining <= TOKEN_EXPIRY_MARGIN_SECONDS:
+        return None
+
+    return token, expiry
+
+
+# Write a cache file readable only by the current user; caching is best-effort
+def _write_private_file(path, data):
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        # The mode above only applies on creation; tighten an existing file too
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+    except OSError:
+        pass
+
+
+def save_cached_token(cache_path, key_id, token, expiry):
+    cached = {
+        "token": token,
+        "expiry_iso": expiry.isoformat(),
+        "key_id": key_id,
+        "scopes": SCOPES,
+    }
+    _write_private_file(cache_path, json.dumps(cached).encode("utf-8"))
+
+
+# Return the pickled signer for this key; only trust a cache file that
+# belongs to the current user and isn't readable/writable by anyone else
+def load_cached_signer(cache_path, key_id):
+    try:
+        st = os.stat(cache_path)
+        if st.st_mode & 0o077 or (hasattr(os, "getuid") and st.st_uid != os.getuid()):
+            return None
+
+        with open(cache_path, "rb") as f:
+            cached = pickle.load(f)
+
+        if cached.get("key_id") != key_id:
+            return None
+        return cached["signer"]
+    except (OSError, EOFError, pickle.UnpicklingError, ImportError, AttributeError, KeyError):
+        return None
+
+
+def save_cached_signer(cache_path, key_id, signer):
+    try:
+        data = pickle.dumps({"key_id": key_id, "signer": signer}, pickle.HIGHEST_PROTOCOL)
+    except (TypeError, AttributeError, pickle.PicklingError):
+        # e.g. signers backed by `cryptography` keys can't be pickled
+        return
+    _write_private_file(cache_path, data)
+
+
+# Seconds to wait on a Google API response before giving up
+HTTP_TIMEOUT_SECONDS = 30
+
+
+# Optional speed-up: decode Sheets responses with orjson when it's installed
+def _orjson_response_hook(response, *args, **kwargs):
+    import orjson
+
+    response.json = lambda **json_kwargs: orjson.loads(response.content)
+    return response
+
+
+# Pooled keep-alive HTTPS sessions: an AuthorizedSession for Sheets calls and
+# the plain auth request it (and our first refresh) uses for the token endpoint.
+# Sheets reads/updates are retried with backoff on rate limits (429) and 5xx;
+# POST (append) isn't retried so a row can't be added twice.
+def build_session(creds):
+    import requests
+    from google.auth.transport.requests import AuthorizedSession, Request
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    auth_session = requests.Session()
+    auth_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+    auth_request = Request(auth_session)
+
+    retries = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "PUT"],
+        raise_on_status=False,
+    )
+
+    session = AuthorizedSession(creds, auth_request=auth_request, refresh_timeout=10)
+    session.mount(
+        "https://", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retries)
+    )
+
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        session.hooks["response"].append(_orjson_response_hook)
+
+    return session, auth_request
+
+
+# Read and parse the service account JSON once per process
+@functools.lru_cache(maxsize=None)
+def load_service_account_info(creds_path):
+    try:
+        with open(creds_path, "rb") as f:
+            return json.loads(f.read())
+    except FileNotFoundError as e:
         raise FileNotFoundError(
             f"\nCredentials file not found: {creds_path}\n\n"
             "Fix:\n"
             "  export PT_CREDS_PATH=/full/path/to/service-account-key.json\n"
+        ) from e
+
+
+# Only the parts of spreadsheets.get the CLI uses (skips formats, protections, etc.)
+SPREADSHEET_METADATA_FIELDS = (
+    "spreadsheetId,properties.title,"
+    "sheets.properties(sheetId,title,index,gridProperties(rowCount,columnCount))"
+)
+
+
+# Build gspread objects from an already-fetched spreadsheets.get response
+# (gspread.Spreadsheet() would re-fetch the same metadata when constructed)
+def worksheet_from_metadata(gspread_client, metadata, index=0):
+    import gspread
+
+    sheet = gspread.Spreadsheet.__new__(gspread.Spreadsheet)
+    sheet.client = gspread_client
+    sheet._properties = {"id": metadata["spreadsheetId"], **metadata["properties"]}
+    return gspread.Worksheet(sheet, metadata["sheets"][index]["properties"])
+
+
+# Worksheet properties for a tab pinned via PT_WORKSHEET_TITLE/PT_WORKSHEET_GID,
+# or None if neither is set
+def get_pinned_tab():
+    worksheet_title = os.getenv("PT_WORKSHEET_TITLE", "").strip()
+    worksheet_gid = os.getenv("PT_WORKSHEET_GID", "").strip()
+    if not (worksheet_title or worksheet_gid):
+        return None
+
+    if worksheet_gid and not worksheet_gid.isdigit():
+        raise ValueError(
+            f"\nPT_WORKSHEET_GID must be a number, got {worksheet_gid!r}.\n\n"
+            "Fix: open your Google Sheet in the browser and copy the number after\n"
+            "#gid= in the URL (the first tab is usually 0).\n"
+            "Then:\n"
+            "  export PT_WORKSHEET_GID=<THAT_NUMBER>\n"
+            "or unset it, and rerun.\n"
         )
 
+    return {"sheetId": int(worksheet_gid or 0), "title": worksheet_title or "Sheet1", "index": 0}
+
+
+# Local-only config checks (creds file present, real spreadsheet ID, valid pinned
+# tab); no network, so main can run them up front and report bad config before
+# showing the menu
+def validate_config():
+    # Fail fast if creds file does not exist
+    service_account_info = load_service_account_info(get_creds_path())
+
     # Read spreadsheet ID from env var or fall back to default
     spreadsheet_id = os.getenv("PT_SPREADSHEET_ID", DEFAULT_SPREADSHEET_ID).strip()
 
@@ -78,18 +310,86 @@ def connect_to_google_sheet():
             "and rerun.\n"
         )
 
-    service_account_email = None
-    try:
-        with open(creds_path, "r", encoding="utf-8") as f:
-            service_account_email = json.load(f).get("client_email")
-    except Exception:
-        service_account_email = None
+    get_pinned_tab()
+
+    return service_account_info, spreadsheet_id
+
+
+# Connect once per process; gspread/google-auth are imported here so that
+# importing this module (tests, quick exits) doesn't pay for them
+@functools.lru_cache(maxsize=1)
+def get_worksheet():
+    import gspread
+    from google.oauth2.service_account import Credentials
+    from gspread.exceptions import APIError, SpreadsheetNotFound
+    from gspread.urls import SPREADSHEET_URL
+
+    service_account_info, spreadsheet_id = validate_config()
+
+    service_account_email = service_account_info.get("client_email")
+    key_id = token_cache_key(service_account_info.get("private_key_id"))
+    cache_dir = get_cache_dir()
+
+    # Reuse the signer parsed on a previous run so the private key PEM
+    # isn't decoded again on every start
+    signer_cache_path = cache_dir / SIGNER_CACHE_FILENAME
+    signer = load_cached_signer(signer_cache_path, key_id)
+    if signer:
+        # Same fields from_service_account_info takes from the info dict
+        creds = Credentials(
+            signer,
+            service_account_email=service_account_email,
+            token_uri=service_account_info["token_uri"],
+            scopes=SCOPES,
+            project_id=service_account_info.get("project_id"),
+            universe_domain=service_account_info.get("universe_domain", "googleapis.com"),
+            trust_boundary=service_account_info.get("trust_boundary"),
+        )
+    else:
+        creds = Credentials.from_service_account_info(service_account_info, scopes=SCOPES)
+        save_cached_signer(signer_cache_path, key_id, creds.signer)
+
+    session, auth_request = build_session(creds)
 
-    gspread_client = gspread.service_account(filename=str(creds_path))
+    # Reuse a still-valid token from a previous run instead of hitting the
+    # token endpoint; the credentials can still refresh themselves later
+    token_cache_path = cache_dir / TOKEN_CACHE_FILENAME
+    cached = load_cached_token(token_cache_path, key_id)
+    if cached:
+        creds.token, creds.expiry = cached
+    else:
+        creds.refresh(auth_request)
+        save_cached_token(token_cache_path, key_id, creds.token, creds.expiry)
+
+    gspread_client = gspread.Client(auth=creds, session=session)
+    gspread_client.set_timeout(HTTP_TIMEOUT_SECONDS)
+
+    # With the tab pinned via env vars there is nothing to look up, so the
+    # worksheet is built locally without any request
+    pinned_tab = get_pinned_tab()
+    if pinned_tab:
+        return worksheet_from_metadata(
+            gspread_client,
+            {
+                "spreadsheetId": spreadsheet_id,
+                "properties": {},
+                "sheets": [{"properties": pinned_tab}],
+            },
+        )
 
+    # One spreadsheets.get for both the spreadsheet and its tabs, instead of
+    # open_by_key() followed by get_worksheet(0) fetching it a second time
     try:
-        sheet = gspread_client.open_by_key(spreadsheet_id)
-    except SpreadsheetNotFound as e:
+        metadata = gspread_client.request(
+            "get",
+            SPREADSHEET_URL % spreadsheet_id,
+            params={"fields": SPREADSHEET_METADATA_FIELDS},
+        ).json()
+    except APIError as e:
+        if e.response.status_code == 403:
+            raise PermissionError from e
+        if e.response.status_code != 404:
+            raise
         raise SpreadsheetNotFound(
             "\nSpreadsheetNotFound (404).\n"
             "This almost always means the spreadsheet is NOT shared with your service account.\n\n"
@@ -101,63 +401,254 @@ def connect_to_google_sheet():
             "4) Save, then rerun: python3 run.py\n"
         ) from e
 
-    return sheet.get_worksheet(0)
+    return worksheet_from_metadata(gspread_client, metadata)
+
+
+# Run independent blocking calls (e.g. file exports) at the same time so they
+# cost about one wait instead of one each; results come back in order
+def run_concurrently(*calls):
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        futures = [executor.submit(fn, *args) for fn, *args in calls]
+        return [future.result() for future in futures]
+
+
+# Start fn() on a daemon thread and return a Future for its result, so slow
+# setup (auth + first request) overlaps with the user reading the menu and
+# never holds up exiting the program
+def start_in_background(fn):
+    future = Future()
+
+    def worker():
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=worker, daemon=True).start()
+    return future
 
 
 # -------------------- App logic --------------------
 
-# Retrieves min & max years and quarters from all records in worksheet
-def get_year_quarter_range(worksheet_obj):
-    records = worksheet_obj.get_all_records()
-    if not records:
-        return (None, None), (None, None)
+# Price columns in the sheet, after Year and Quarter
+PRICE_COLUMNS = (
+    "Nationally",
+    "Dublin",
+    "Cork",
+    "Galway",
+    "Limerick",
+    "Waterford",
+    "Other_counties",
+)
+
+# Sheet rows (as dicts), fetched once and reused for the rest of the session
+RECORDS_CACHE = None
+
+# The same rows as NumPy columns (Year/Quarter int32, prices float64 with
+# NaN for blank cells), built once from RECORDS_CACHE
+COLUMNS_CACHE = None
+
+
+# Returns the cached sheet records (header row -> cell values), fetching them on
+# first use; built from get_values() since get_all_records() needs the tab's
+# row count, which a worksheet pinned via env vars doesn't have
+def get_records(worksheet_obj):
+    global RECORDS_CACHE
+    if RECORDS_CACHE is None:
+        header, *rows = worksheet_obj.get_values() or [[]]
+        RECORDS_CACHE = [dict(zip(header, row)) for row in rows]
+    return RECORDS_CACHE
+
+
+# Returns the cached sheet columns, building them on first use
+def get_columns(worksheet_obj):
+    global COLUMNS_CACHE
+    if COLUMNS_CACHE is None:
+        COLUMNS_CACHE = build_columns(get_records(worksheet_obj))
+    return COLUMNS_CACHE
+
+
+# Mirrors a row just appended to the sheet in the cache instead of re-fetching
+def cache_appended_row(row):
+    global RECORDS_CACHE, COLUMNS_CACHE
+    if RECORDS_CACHE:
+        RECORDS_CACHE.append(dict(zip(RECORDS_CACHE[0].keys(), row)))
+    else:
+        # No header to map the row onto yet; fetch fresh next time
+        RECORDS_CACHE = None
+    COLUMNS_CACHE = None
 
-    years = sorted({record["Year"] for record in records})
-    min_year, max_year = years[0], years[-1]
 
-    min_year_quarters = {
-        record["Quarter"] for record in records if record["Year"] == min_year
-    }
-    max_year_quarters = {
-        record["Quarter"] for record in records if record["Year"] == max_year
+# Characters stripped from price cells in one translate pass
+_CURRENCY_TBL = str.maketrans("", "", "€, ")
+
+
+# Converts a sheet price cell ("€250,000", 250000 or blank) to a float; NaN if
+# blank or unreadable (e.g. "n/a"), so one bad cell is skipped like a blank one
+# instead of failing the whole load
+def parse_price(value):
+    try:
+        # Exact type check: sheet cells are plain str/int/float, never subclasses
+        if type(value) is str:
+            value = value.translate(_CURRENCY_TBL)
+            return float(value) if value else np.nan
+
+        if value is None:
+            return np.nan
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+# Encodes a year and quarter (1-4) as one sortable integer, e.g. 2024 Q3 -> 20243;
+# plain integer math, and works element-wise on NumPy arrays too
+def period_key(year, quarter):
+    return year * 10 + quarter
+
+
+# Converts records (one dict per row) into one array per column, cleaning
+# the price cells in the same pass so later lookups are plain array indexing
+def build_columns(records):
+    count = len(records)
+    columns = {
+        "Year": np.fromiter(
+            (int(record.get("Year")) for record in records), dtype=np.int32, count=count
+        ),
+        "Quarter": np.fromiter(
+            (int(record.get("Quarter")) for record in records), dtype=np.int32, count=count
+        ),
     }
+    for name in PRICE_COLUMNS:
+        columns[name] = np.fromiter(
+            (parse_price(record.get(name)) for record in records), dtype=np.float64, count=count
+        )
+
+    # Year+quarter as one sortable integer; lookups binary-search it, so keep
+    # the columns in chronological order (the sheet normally already is)
+    columns["Period"] = period_key(columns["Year"], columns["Quarter"])
+    if np.any(np.diff(columns["Period"]) < 0):
+        order = np.argsort(columns["Period"], kind="stable")
+        columns = {name: values[order] for name, values in columns.items()}
+
+    return columns
+
+
+# Price for one period, found by binary search on the sorted periods;
+# None if that quarter is missing or its cell is blank
+def price_at(periods, prices, period):
+    index = int(np.searchsorted(periods, period, side="right")) - 1
+    if index < 0 or periods[index] != period or np.isnan(prices[index]):
+        return None
+    return float(prices[index])
+
+
+# Retrieves min & max years and quarters from the sheet columns; they are
+# sorted by period at load, so the first and last rows are the bounds
+def get_year_quarter_range(columns):
+    years, quarters = columns["Year"], columns["Quarter"]
+    if not years.size:
+        return (None, None), (None, None)
+
+    return (int(years[0]), int(quarters[0])), (int(years[-1]), int(quarters[-1]))
+
+
+# Selects one county's non-blank prices between two periods (inclusive) plus
+# the start/end prices; binary search finds the window on the sorted periods,
+# so only the selected rows are touched (no per-row loop)
+def select_period_range(columns, county, start_period, end_period):
+    periods, prices = columns["Period"], columns[county]
+
+    lo = int(np.searchsorted(periods, start_period, side="left"))
+    hi = int(np.searchsorted(periods, end_period, side="right"))
+    window = prices[lo:hi]
+    present = ~np.isnan(window)
+
+    data_values = window[present].tolist()
+    data_rows = [
+        {"Year": year, "Quarter": quarter, "Price": price}
+        for year, quarter, price in zip(
+            columns["Year"][lo:hi][present].tolist(),
+            columns["Quarter"][lo:hi][present].tolist(),
+            data_values,
+        )
+    ]
+
+    # Endpoints only count inside the window, so a reversed or empty range
+    # (e.g. 2024 Q3 to 2024 Q1) has no start/end price
+    start_price = price_at(periods[lo:hi], window, start_period)
+    end_price = price_at(periods[lo:hi], window, end_period)
+
+    return data_rows, data_values, start_price, end_price
+
+
+# Numeric summary of a dataset; fields that need 2+ values (or any values) are None
+Stats = namedtuple(
+    "Stats",
+    ["mean", "std_dev", "min_value", "max_value", "data_range", "q1", "median", "q3", "iqr"],
+)
+
+
+# Computes every summary statistic in one NumPy pass over a float64 array
+def compute_stats(data_values):
+    arr = np.asarray(data_values, dtype=np.float64)
+    if arr.size == 0:
+        return Stats(None, None, None, None, None, None, None, None, None)
+
+    min_value, max_value = float(arr.min()), float(arr.max())
+    q1, median, q3 = (float(q) for q in np.percentile(arr, [25, 50, 75]))
+
+    if arr.size < 2:
+        return Stats(
+            mean=None,
+            std_dev=None,
+            min_value=min_value,
+            max_value=max_value,
+            data_range=max_value - min_value,
+            q1=None,
+            median=median,
+            q3=None,
+            iqr=None,
+        )
+
+    return Stats(
+        mean=float(arr.mean()),
+        std_dev=float(arr.std(ddof=1)),
+        min_value=min_value,
+        max_value=max_value,
+        data_range=max_value - min_value,
+        q1=q1,
+        median=median,
+        q3=q3,
+        iqr=q3 - q1,
+    )
 
-    min_quarter = min(min_year_quarters)
-    max_quarter = max(max_year_quarters)
 
-    return (min_year, min_quarter), (max_year, max_quarter)
+# Formats precomputed Stats for display, defaulting to "N/A" when data is insufficient
+def format_statistics(stats):
+    values = {
+        "average": stats.mean,
+        "std_dev": stats.std_dev,
+        "min_value": stats.min_value,
+        "max_value": stats.max_value,
+        "data_range": stats.data_range,
+        "Q1": stats.q1,
+        "median": stats.median,
+        "Q3": stats.q3,
+        "IQR": stats.iqr,
+    }
+    return {key: "N/A" if value is None else f"{value:,.2f}" for key, value in values.items()}
 
 
 # Calculates and returns statistical measures for dataset,
 # defaulting to "N/A" when data is insufficient
 def calculate_statistics(data_values):
-    stats = {
-        "average": "N/A",
-        "std_dev": "N/A",
-        "min_value": "N/A",
-        "max_value": "N/A",
-        "data_range": "N/A",
-        "Q1": "N/A",
-        "median": "N/A",
-        "Q3": "N/A",
-        "IQR": "N/A",
-    }
-
-    if data_values:
-        stats["min_value"] = f"{min(data_values):,.2f}"
-        stats["max_value"] = f"{max(data_values):,.2f}"
-        stats["data_range"] = f"{max(data_values) - min(data_values):,.2f}"
-        stats["median"] = f"{statistics.median(data_values):,.2f}"
+    return format_statistics(compute_stats(data_values))
 
-        if len(data_values) >= 2:
-            stats["average"] = f"{statistics.mean(data_values):,.2f}"
-            stats["std_dev"] = f"{statistics.stdev(data_values):,.2f}"
-            q25, q75 = np.percentile(data_values, [25, 75])
-            stats["Q1"] = f"{q25:,.2f}"
-            stats["Q3"] = f"{q75:,.2f}"
-            stats["IQR"] = f"{q75 - q25:,.2f}"
 
-    return stats
+# True if a yes/no answer starts with "y" (any case); only the first character
+# is looked at, so long pasted input isn't lowercased in full
+def is_yes(answer):
+    return answer[:1] in ("y", "Y")
 
 
 # Prompts the user to input valid integers, optionally constrained to a range
@@ -183,81 +674,91 @@ def get_integer_input(prompt, range_min=None, range_max=None):
             )
 
 
-# Save analysis summary and stats to a local text file
+# Append-mode handle to the text export, opened on first export and kept for the
+# session so repeated exports don't reopen the file
+TEXT_EXPORT_FILE = None
+
+
+# Returns the session's buffered append handle for path, reopening if path changed
+def get_text_export_file(path):
+    global TEXT_EXPORT_FILE
+    if TEXT_EXPORT_FILE is None or TEXT_EXPORT_FILE.name != str(path):
+        close_text_export_file()
+        TEXT_EXPORT_FILE = open(path, "a", encoding="utf-8", buffering=65536)
+    return TEXT_EXPORT_FILE
+
+
+# Closes the session's text export handle, if one is open
+def close_text_export_file():
+    global TEXT_EXPORT_FILE
+    if TEXT_EXPORT_FILE is not None:
+        TEXT_EXPORT_FILE.close()
+        TEXT_EXPORT_FILE = None
+
+
+atexit.register(close_text_export_file)
+
+
+# Save analysis summary and precomputed stats to a local text file
 def save_to_text_file(
-    data_values, summary_message, start_year, start_quarter, end_year, end_quarter, selected_county
+    stats, summary_message, start_year, start_quarter, end_year, end_quarter, selected_county
 ):
     output_path = Path(__file__).resolve().parent / "analysis_results.txt"
 
-    average_formatted = "N/A"
-    std_dev_formatted = "N/A"
-    min_value_formatted = "N/A"
-    max_value_formatted = "N/A"
-    data_range_formatted = "N/A"
-    Q1_formatted = "N/A"
-    median_formatted = "N/A"
-    Q3_formatted = "N/A"
-    IQR_formatted = "N/A"
-
-    if data_values:
-        min_value = min(data_values)
-        max_value = max(data_values)
-        data_range = max_value - min_value
-        median = statistics.median(data_values)
-
-        min_value_formatted = f"{min_value:8,.2f}"
-        max_value_formatted = f"{max_value:8,.2f}"
-        data_range_formatted = f"{data_range:8,.2f}"
-        median_formatted = f"{median:8,.2f}"
-
-        if len(data_values) >= 2:
-            average = statistics.mean(data_values)
-            std_dev = statistics.stdev(data_values)
-            Q1 = np.percentile(data_values, 25)
-            Q3 = np.percentile(data_values, 75)
-            IQR = Q3 - Q1
-
-            average_formatted = f"{average:8,.2f}"
-            std_dev_formatted = f"{std_dev:8,.2f}"
-            Q1_formatted = f"{Q1:8,.2f}"
-            Q3_formatted = f"{Q3:8,.2f}"
-            IQR_formatted = f"{IQR:8,.2f}"
-
-    with open(output_path, "a", encoding="utf-8") as file:
-        file.write("\n +--------------------------------------------------+\n")
-        file.write(" |              Summary of Price Changes            |\n")
-        file.write(" +--------------------------------------------------+\n")
-        file.write(
-            f"\n                From {start_year} Q{start_quarter} to "
-            f"{end_year} Q{end_quarter}\n"
-        )
-        file.write(f"            {summary_message}\n")
-        file.write(f"               New Property - {selected_county}\n")
-        file.write("\n +--------------------------------------------------+\n")
-
-        if data_values:
-            file.write(" |                Summary Statistics:               |\n")
-            file.write(" +--------------------------------------------------+\n")
-            file.write(f"\n       Average (mean):               €{average_formatted}\n")
-            file.write(f"       Standard Deviation (+/-):     €{std_dev_formatted}\n")
-            file.write("\n +--------------------------------------------------+\n")
-            file.write(f"\n       Minimum Value:                €{min_value_formatted}\n")
-            file.write(f"       Maximum Value:                €{max_value_formatted}\n")
-            file.write(f"       Range:                        €{data_range_formatted}\n")
-            file.write("\n +--------------------------------------------------+\n")
-            file.write(f"\n       Lower Quartile (Q1):          €{Q1_formatted}\n")
-            file.write(f"       Median (Q2):                  €{median_formatted}\n")
-            file.write(f"       Upper Quartile (Q3):          €{Q3_formatted}\n")
-            file.write(f"       IQR:                          €{IQR_formatted}\n")
-            file.write("\n +--------------------------------------------------+\n")
+    def fmt(value):
+        return "N/A" if value is None else f"{value:8,.2f}"
+
+    average_formatted = fmt(stats.mean)
+    std_dev_formatted = fmt(stats.std_dev)
+    min_value_formatted = fmt(stats.min_value)
+    max_value_formatted = fmt(stats.max_value)
+    data_range_formatted = fmt(stats.data_range)
+    Q1_formatted = fmt(stats.q1)
+    median_formatted = fmt(stats.median)
+    Q3_formatted = fmt(stats.q3)
+    IQR_formatted = fmt(stats.iqr)
+
+    parts = [
+        "\n +--------------------------------------------------+\n",
+        " |              Summary of Price Changes            |\n",
+        " +--------------------------------------------------+\n",
+        f"\n                From {start_year} Q{start_quarter} to {end_year} Q{end_quarter}\n",
+        f"            {summary_message}\n",
+        f"               New Property - {selected_county}\n",
+        "\n +--------------------------------------------------+\n",
+    ]
+
+    if stats.min_value is not None:
+        parts += [
+            " |                Summary Statistics:               |\n",
+            " +--------------------------------------------------+\n",
+            f"\n       Average (mean):               €{average_formatted}\n",
+            f"       Standard Deviation (+/-):     €{std_dev_formatted}\n",
+            "\n +--------------------------------------------------+\n",
+            f"\n       Minimum Value:                €{min_value_formatted}\n",
+            f"       Maximum Value:                €{max_value_formatted}\n",
+            f"       Range:                        €{data_range_formatted}\n",
+            "\n +--------------------------------------------------+\n",
+            f"\n       Lower Quartile (Q1):          €{Q1_formatted}\n",
+            f"       Median (Q2):                  €{median_formatted}\n",
+            f"       Upper Quartile (Q3):          €{Q3_formatted}\n",
+            f"       IQR:                          €{IQR_formatted}\n",
+            "\n +--------------------------------------------------+\n",
+        ]
+
+    # One write per export instead of one per line; flushed so the results are on
+    # disk as soon as the export is reported, while the handle stays open
+    file = get_text_export_file(output_path)
+    file.write("".join(parts))
+    file.flush()
 
     return output_path
 
 
-# Save detailed rows + summary columns to a CSV for Excel-friendly analysis
+# Save detailed rows + precomputed summary columns to a CSV for Excel-friendly analysis
 def save_to_csv_file(
     data_rows,
-    data_values,
+    stats,
     summary_message,
     start_year,
     start_quarter,
@@ -273,18 +774,7 @@ def save_to_csv_file(
         / f"analysis_{start_year}Q{start_quarter}_{end_year}Q{end_quarter}_{safe_county}.csv"
     )
 
-    mean_v = statistics.mean(data_values) if len(data_values) >= 2 else None
-    std_v = statistics.stdev(data_values) if len(data_values) >= 2 else None
-    min_v = min(data_values) if data_values else None
-    max_v = max(data_values) if data_values else None
-    range_v = (max_v - min_v) if (min_v is not None and max_v is not None) else None
-    median_v = statistics.median(data_values) if data_values else None
-
-    q1_v = q3_v = iqr_v = None
-    if len(data_values) >= 2:
-        q25, q75 = np.percentile(data_values, [25, 75])
-        q1_v, q3_v = float(q25), float(q75)
-        iqr_v = q3_v - q1_v
+    mean_v, std_v, min_v, max_v, range_v, q1_v, median_v, q3_v, iqr_v = stats
 
     pct_change = None
     if start_price is not None and end_price is not None and start_price != 0:
@@ -314,65 +804,34 @@ def save_to_csv_file(
         "SummaryMessage",
     ]
 
-    data_rows_sorted = sorted(data_rows, key=lambda r: (r["Year"], r["Quarter"]))
-
-    with open(csv_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for r in data_rows_sorted:
-            writer.writerow(
-                {
-                    "StartYear": start_year,
-                    "StartQuarter": start_quarter,
-                    "EndYear": end_year,
-                    "EndQuarter": end_quarter,
-                    "County": selected_county,
-                    "Year": r["Year"],
-                    "Quarter": r["Quarter"],
-                    "Price": r["Price"],
-                    "StartPrice": start_price,
-                    "EndPrice": end_price,
-                    "PercentChange": pct_change,
-                    "Mean": mean_v,
-                    "StdDev": std_v,
-                    "Min": min_v,
-                    "Max": max_v,
-                    "Range": range_v,
-                    "Q1": q1_v,
-                    "Median": median_v,
-                    "Q3": q3_v,
-                    "IQR": iqr_v,
-                    "SummaryMessage": summary_message,
-                }
-            )
-
-        if not data_rows_sorted:
-            writer.writerow(
-                {
-                    "StartYear": start_year,
-                    "StartQuarter": start_quarter,
-                    "EndYear": end_year,
-                    "EndQuarter": end_quarter,
-                    "County": selected_county,
-                    "Year": None,
-                    "Quarter": None,
-                    "Price": None,
-                    "StartPrice": start_price,
-                    "EndPrice": end_price,
-                    "PercentChange": pct_change,
-                    "Mean": mean_v,
-                    "StdDev": std_v,
-                    "Min": min_v,
-                    "Max": max_v,
-                    "Range": range_v,
-                    "Q1": q1_v,
-                    "Median": median_v,
-                    "Q3": q3_v,
-                    "IQR": iqr_v,
-                    "SummaryMessage": summary_message,
-                }
-            )
+    # Every column except Year/Quarter/Price is constant across the export
+    const_prefix = (start_year, start_quarter, end_year, end_quarter, selected_county)
+    const_suffix = (
+        start_price,
+        end_price,
+        pct_change,
+        mean_v,
+        std_v,
+        min_v,
+        max_v,
+        range_v,
+        q1_v,
+        median_v,
+        q3_v,
+        iqr_v,
+        summary_message,
+    )
+    rows = [
+        const_prefix + (r["Year"], r["Quarter"], r["Price"]) + const_suffix
+        # Already chronological: build_columns sorts by period at load
+        for r in data_rows
+    ] or [const_prefix + (None, None, None) + const_suffix]
+
+    # One large buffer so the whole export usually reaches disk in a single write
+    with open(csv_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
 
     return csv_path
 
@@ -380,7 +839,7 @@ def save_to_csv_file(
 # Ask user whether to export, then write both TXT and CSV if yes
 def save_results(
     data_rows,
-    data_values,
+    stats,
     summary_message,
     start_year,
     start_quarter,
@@ -390,78 +849,96 @@ def save_results(
     start_price,
     end_price,
 ):
-    save_choice = input("        Like to export results? (yes/no): ").lower()
-
-    if save_choice.startswith("y"):
-        txt_path = save_to_text_file(
-            data_values,
-            summary_message,
-            start_year,
-            start_quarter,
-            end_year,
-            end_quarter,
-            selected_county,
-        )
-        csv_path = save_to_csv_file(
-            data_rows,
-            data_values,
-            summary_message,
-            start_year,
-            start_quarter,
-            end_year,
-            end_quarter,
-            selected_county,
-            start_price,
-            end_price,
+    save_choice = input("        Like to export results? (yes/no): ")
+
+    if is_yes(save_choice):
+        # The two files are independent, so write them at the same time
+        txt_path, csv_path = run_concurrently(
+            (
+                save_to_text_file,
+                stats,
+                summary_message,
+                start_year,
+                start_quarter,
+                end_year,
+                end_quarter,
+                selected_county,
+            ),
+            (
+                save_to_csv_file,
+                data_rows,
+                stats,
+                summary_message,
+                start_year,
+                start_quarter,
+                end_year,
+                end_quarter,
+                selected_county,
+                start_price,
+                end_price,
+            ),
         )
         print(f"\n Results saved to:\n  {txt_path}\n  {csv_path}\n")
     else:
         print("\n         These results have not been saved.\n")
 
 
-# Get the last row (latest year/quarter) from the sheet
-def get_last_year_quarter(worksheet_obj):
-    last_row = worksheet_obj.get_all_values()[-1]
-    last_year = int(last_row[0])
-    last_quarter = int(last_row[1])
-    return last_year, last_quarter
+# Get the latest year/quarter from the cached columns (sorted by period at load),
+# so Option 1 needs no extra fetch of the sheet
+def get_last_year_quarter(columns):
+    return int(columns["Year"][-1]), int(columns["Quarter"][-1])
 
 
 # -------------------- Main Menu Loop --------------------
 
+MENU_OPTIONS = {
+    "1": "Add new information to database",
+    "2": "Perform analysis on existing database",
+    "3": "Exit",
+}
 
-def main():
-    worksheet = connect_to_google_sheet()
-
-    while True:
-        options = {
-            "1": "Add new information to database",
-            "2": "Perform analysis on existing database",
-            "3": "Exit",
-        }
-
-        print(" +--------------------------------------------------+")
-        print("\n     Welcome to 'P r o p e r t y  T r a c k e r'\n")
-        print("  Keeping you up-to-date with Irish property trends")
-
-        menu_table = f"""
+# The menu never changes, so it is rendered once at import
+MENU_TABLE = f"""
      +--------------------------------------------------+
      | Press |                 Action                   |
      +--------------------------------------------------+
-     |   {'1':<3} | {options['1']:<40} |
-     |   {'2':<3} | {options['2']:<40} |
-     |   {'3':<3} | {options['3']:<40} |
+     |   {'1':<3} | {MENU_OPTIONS['1']:<40} |
+     |   {'2':<3} | {MENU_OPTIONS['2']:<40} |
+     |   {'3':<3} | {MENU_OPTIONS['3']:<40} |
      +--------------------------------------------------+
     """
-        print(menu_table)
+
+# Banner plus menu, written with a single call on each pass of the loop
+MENU_SCREEN = (
+    " +--------------------------------------------------+\n"
+    "\n     Welcome to 'P r o p e r t y  T r a c k e r'\n\n"
+    "  Keeping you up-to-date with Irish property trends\n"
+    f"{MENU_TABLE}\n"
+)
+
+# County menu numbered from PRICE_COLUMNS, so choice N selects PRICE_COLUMNS[N - 1]
+COUNTY_MENU = "\n Select the county for analysis:\n" + "".join(
+    f" {number}: {county.replace('_', ' ')}\n"
+    for number, county in enumerate(PRICE_COLUMNS, start=1)
+)
+
+
+def main():
+    # Bad config is reported straight away; only the network part is deferred
+    validate_config()
+    worksheet_future = start_in_background(get_worksheet)
+
+    while True:
+        sys.stdout.write(MENU_SCREEN)
         choice = input("    Please select your choice and hit 'Enter': ")
         print("\n +--------------------------------------------------+")
 
         # -------- Option 1: Add new information --------
         if choice == "1":
-            (min_year, min_quarter), (max_year, max_quarter) = get_year_quarter_range(worksheet)
-
-            last_year, last_quarter = get_last_year_quarter(worksheet)
+            worksheet = worksheet_future.result()
+            columns = get_columns(worksheet)
+            (min_year, min_quarter), (max_year, max_quarter) = get_year_quarter_range(columns)
+            last_year, last_quarter = get_last_year_quarter(columns)
             next_year, next_quarter = last_year, last_quarter
 
             if last_quarter < 4:
@@ -470,13 +947,13 @@ def main():
                 next_year += 1
                 next_quarter = 1
 
-            print("\n   Current data available from imported CSO dataset")
-            print(
+            sys.stdout.write(
+                "\n   Current data available from imported CSO dataset\n"
                 f"    Quarter {min_quarter}, Year {min_year} to Quarter "
-                f"{last_quarter}, Year {last_year}"
+                f"{last_quarter}, Year {last_year}\n"
+                f" Please enter new data for next Quarter {next_quarter}, Year {next_year}:\n"
+                "\n +--------------------------------------------------+\n\n"
             )
-            print(f" Please enter new data for next Quarter {next_quarter}, Year {next_year}:")
-            print("\n +--------------------------------------------------+\n")
 
             nationally = get_integer_input("      Avg Price Nationally:      €")
             dublin = get_integer_input("      Avg Price Dublin:          €")
@@ -498,21 +975,25 @@ def main():
                 other_counties,
             ]
 
-            print("\n +--------------------------------------------------+\n")
-            print("      Summary of the data entered:\n")
-            print(f"       Year:                      {next_year}")
-            print(f"       Quarter:                    {next_quarter}")
-            print(f"       Avg Price Nationally:      €{nationally}")
-            print(f"       Avg Price Dublin:          €{dublin}")
-            print(f"       Avg Price Cork:            €{cork}")
-            print(f"       Avg Price Galway:          €{galway}")
-            print(f"       Avg Price Limerick:        €{limerick}")
-            print(f"       Avg Price Waterford:       €{waterford}")
-            print(f"       Avg Price Other Counties:  €{other_counties}\n")
+            lines = [
+                "\n +--------------------------------------------------+\n",
+                "      Summary of the data entered:\n",
+                f"       Year:                      {next_year}",
+                f"       Quarter:                    {next_quarter}",
+                f"       Avg Price Nationally:      €{nationally}",
+                f"       Avg Price Dublin:          €{dublin}",
+                f"       Avg Price Cork:            €{cork}",
+                f"       Avg Price Galway:          €{galway}",
+                f"       Avg Price Limerick:        €{limerick}",
+                f"       Avg Price Waterford:       €{waterford}",
+                f"       Avg Price Other Counties:  €{other_counties}\n",
+            ]
+            sys.stdout.write("\n".join(lines) + "\n")
 
             confirm = input("     Is the entered data correct? (yes/no): ")
-            if confirm.lower().startswith("y"):
+            if is_yes(confirm):
                 worksheet.append_row(row)
+                cache_appended_row(row)
                 print("\n    New information has been added to database.\n")
             else:
                 print("\n       Data entry cancelled - no data added.\n")
@@ -520,7 +1001,9 @@ def main():
 
         # -------- Option 2: Perform analysis --------
         elif choice == "2":
-            (min_year, min_quarter), (max_year, max_quarter) = get_year_quarter_range(worksheet)
+            worksheet = worksheet_future.result()
+            columns = get_columns(worksheet)
+            (min_year, min_quarter), (max_year, max_quarter) = get_year_quarter_range(columns)
 
             if not min_year or not max_year:
                 print("\n No data available in the database to perform analysis.")
@@ -528,6 +1011,7 @@ def main():
 
             data_values = []
             data_rows = []
+            stats = compute_stats(data_values)
             start_price = None
             end_price = None
             summary_message = "No data available for that range!"
@@ -560,62 +1044,26 @@ def main():
                 end_quarter_range,
             )
 
-            print("\n Select the county for analysis:")
-            print(" 1: Nationally")
-            print(" 2: Dublin")
-            print(" 3: Cork")
-            print(" 4: Galway")
-            print(" 5: Limerick")
-            print(" 6: Waterford")
-            print(" 7: Other counties")
-            county_choice = get_integer_input("\n Enter the number for selected county: ", 1, 7)
-
-            county_column_mapping = {
-                1: "Nationally",
-                2: "Dublin",
-                3: "Cork",
-                4: "Galway",
-                5: "Limerick",
-                6: "Waterford",
-                7: "Other_counties",
-            }
-            selected_county = county_column_mapping[county_choice]
+            sys.stdout.write(COUNTY_MENU)
+            county_choice = get_integer_input(
+                "\n Enter the number for selected county: ", 1, len(PRICE_COLUMNS)
+            )
+            selected_county = PRICE_COLUMNS[county_choice - 1]
 
             try:
-                records = worksheet.get_all_records()
-
-                start_period = int(f"{start_year}{start_quarter}")
-                end_period = int(f"{end_year}{end_quarter}")
-
-                for record in records:
-                    record_year = int(record.get("Year"))
-                    record_quarter = int(record.get("Quarter"))
-                    record_period = int(f"{record_year}{record_quarter}")
-
-                    if start_period <= record_period <= end_period:
-                        value = record.get(selected_county)
-
-                        if isinstance(value, str):
-                            value = value.replace("€", "").replace(",", "")
-
-                        if value is not None and value != "":
-                            float_value = float(value)
-                            data_values.append(float_value)
-
-                            data_rows.append(
-                                {"Year": record_year, "Quarter": record_quarter, "Price": float_value}
-                            )
-
-                            if record_year == start_year and record_quarter == start_quarter:
-                                start_price = float_value
-                            if record_year == end_year and record_quarter == end_quarter:
-                                end_price = float_value
+                start_period = period_key(start_year, start_quarter)
+                end_period = period_key(end_year, end_quarter)
+                data_rows, data_values, start_price, end_price = select_period_range(
+                    columns, selected_county, start_period, end_period
+                )
 
                 if not data_values:
-                    print("\n +--------------------------------------------------+")
-                    print("       No data available for the range chosen\n")
-                    print("                  Please try again!")
-                    print(" +--------------------------------------------------+\n")
+                    sys.stdout.write(
+                        "\n +--------------------------------------------------+\n"
+                        "       No data available for the range chosen\n\n"
+                        "                  Please try again!\n"
+                        " +--------------------------------------------------+\n\n"
+                    )
                 else:
                     if start_price is not None and end_price is not None and start_price != 0:
                         percentage_change = ((end_price - start_price) / start_price) * 100
@@ -624,37 +1072,42 @@ def main():
                     else:
                         summary_message = "Unable to calculate overall price changes (incomplete data)."
 
-                    print("\n +--------------------------------------------------+")
-                    print(" |              Summary of Price Changes:           |")
-                    print(" +--------------------------------------------------+")
-                    print(f"                From {start_year} Q{start_quarter} to {end_year} Q{end_quarter}")
-                    print(f"            {summary_message}")
-                    print(f"               New Property - {selected_county}")
-                    print(" +--------------------------------------------------+")
-
-                    stats = calculate_statistics(data_values)
-
-                    print(" |                Summary Statistics:               |")
-                    print(" +--------------------------------------------------+")
-                    print(f"       Average (mean):              €{stats['average']}")
-                    print(f"       Standard Deviation (+/-):    €{stats['std_dev']}")
-                    print(" +--------------------------------------------------+")
-                    print(f"       Minimum Value:               €{stats['min_value']}")
-                    print(f"       Maximum Value:               €{stats['max_value']}")
-                    print(f"       Range:                       €{stats['data_range']}")
-                    print(" +--------------------------------------------------+")
-                    print(f"       Lower Quartile (Q1):         €{stats['Q1']}")
-                    print(f"       Median (Q2):                 €{stats['median']}")
-                    print(f"       Upper Quartile (Q3):         €{stats['Q3']}")
-                    print(f"       IQR:                         €{stats['IQR']}")
-                    print(" +--------------------------------------------------+\n")
+                    # Computed once here and reused by both exports below
+                    stats = compute_stats(data_values)
+                    formatted = format_statistics(stats)
+
+                    # Build the whole summary box and write it in one go
+                    lines = [
+                        "\n +--------------------------------------------------+",
+                        " |              Summary of Price Changes:           |",
+                        " +--------------------------------------------------+",
+                        f"                From {start_year} Q{start_quarter} to {end_year} Q{end_quarter}",
+                        f"            {summary_message}",
+                        f"               New Property - {selected_county}",
+                        " +--------------------------------------------------+",
+                        " |                Summary Statistics:               |",
+                        " +--------------------------------------------------+",
+                        f"       Average (mean):              €{formatted['average']}",
+                        f"       Standard Deviation (+/-):    €{formatted['std_dev']}",
+                        " +--------------------------------------------------+",
+                        f"       Minimum Value:               €{formatted['min_value']}",
+                        f"       Maximum Value:               €{formatted['max_value']}",
+                        f"       Range:                       €{formatted['data_range']}",
+                        " +--------------------------------------------------+",
+                        f"       Lower Quartile (Q1):         €{formatted['Q1']}",
+                        f"       Median (Q2):                 €{formatted['median']}",
+                        f"       Upper Quartile (Q3):         €{formatted['Q3']}",
+                        f"       IQR:                         €{formatted['IQR']}",
+                        " +--------------------------------------------------+\n",
+                    ]
+                    sys.stdout.write("\n".join(lines) + "\n")
 
             except Exception as e:
                 print(f"\n An error occurred: {e}")
 
             save_results(
                 data_rows,
-                data_values,
+                stats,
                 summary_message,
                 start_year,
                 start_quarter,
@@ -667,8 +1120,10 @@ def main():
 
         # -------- Option 3: Exit --------
         elif choice == "3":
-            print("\n Exiting program...\n\n Thanks for using this app, bye!")
-            print("\n +--------------------------------------------------+")
+            sys.stdout.write(
+                "\n Exiting program...\n\n Thanks for using this app, bye!\n"
+                "\n +--------------------------------------------------+\n"
+            )
             break
 
         # -------- Invalid choice --------
@@ -1,31 +1,45 @@
 import csv
+import threading
+from datetime import datetime, timedelta
+
+import pytest
 
 import run
 
 
 class FakeWorksheet:
-    def __init__(self, records=None, values=None):
-        self._records = records or []
+    def __init__(self, values=None):
         self._values = values or []
 
-    def get_all_records(self):
-        return self._records
-
-    def get_all_values(self):
+    def get_values(self):
         return self._values
 
 
 def test_get_year_quarter_range_returns_min_and_max():
-    worksheet = FakeWorksheet(
-        records=[
-            {"Year": 2024, "Quarter": 2},
-            {"Year": 2023, "Quarter": 4},
-            {"Year": 2024, "Quarter": 1},
-            {"Year": 2022, "Quarter": 3},
-        ]
-    )
+    records = [
+        {"Year": 2024, "Quarter": 2},
+        {"Year": 2023, "Quarter": 4},
+        {"Year": 2024, "Quarter": 1},
+        {"Year": 2022, "Quarter": 3},
+    ]
+
+    assert run.get_year_quarter_range(run.build_columns(records)) == ((2022, 3), (2024, 2))
+
 
-    assert run.get_year_quarter_range(worksheet) == ((2022, 3), (2024, 2))
+def test_get_columns_fetches_once_and_tracks_appended_rows(monkeypatch):
+    monkeypatch.setattr(run, "RECORDS_CACHE", None)
+    monkeypatch.setattr(run, "COLUMNS_CACHE", None)
+    worksheet = FakeWorksheet(values=[["Year", "Quarter", "Dublin"], ["2024", "1", "€400,000"]])
+    fetches = []
+    worksheet.get_values = lambda: fetches.append(1) or worksheet._values
+
+    run.get_columns(worksheet)
+    run.cache_appended_row([2024, 2, 410000])
+    columns = run.get_columns(worksheet)
+
+    assert len(fetches) == 1
+    assert columns["Quarter"].tolist() == [1, 2]
+    assert columns["Dublin"].tolist() == [400000.0, 410000.0]
 
 
 def test_calculate_statistics_for_multiple_values():
@@ -53,26 +67,34 @@ def test_calculate_statistics_for_single_value_keeps_non_applicable_fields():
     assert stats["IQR"] == "N/A"
 
 
-def test_get_last_year_quarter_reads_last_row():
-    worksheet = FakeWorksheet(
-        values=[
-            ["2024", "3"],
-            ["2024", "4"],
+def test_is_yes_checks_only_the_first_character():
+    assert run.is_yes("yes")
+    assert run.is_yes("Y")
+    assert not run.is_yes("no")
+    assert not run.is_yes("")
+    assert not run.is_yes(" yes")
+
+
+def test_get_last_year_quarter_reads_latest_period_from_columns():
+    columns = run.build_columns(
+        [
+            {"Year": 2024, "Quarter": 4},
+            {"Year": 2024, "Quarter": 3},
         ]
     )
 
-    assert run.get_last_year_quarter(worksheet) == (2024, 4)
+    assert run.get_last_year_quarter(columns) == (2024, 4)
 
 
-def test_save_to_csv_file_writes_sorted_rows_and_summary(tmp_path, monkeypatch):
+def test_save_to_csv_file_writes_rows_and_summary(tmp_path, monkeypatch):
     monkeypatch.setattr(run, "__file__", str(tmp_path / "run.py"))
 
     csv_path = run.save_to_csv_file(
         data_rows=[
-            {"Year": 2024, "Quarter": 2, "Price": 220000.0},
             {"Year": 2024, "Quarter": 1, "Price": 200000.0},
+            {"Year": 2024, "Quarter": 2, "Price": 220000.0},
         ],
-        data_values=[200000.0, 220000.0],
+        stats=run.compute_stats([200000.0, 220000.0]),
         summary_message="Prices have increased by 10.00%",
         start_year=2024,
         start_quarter=1,
@@ -90,4 +112,253 @@ def test_save_to_csv_file_writes_sorted_rows_and_summary(tmp_path, monkeypatch):
 
     assert [row["Quarter"] for row in rows] == ["1", "2"]
     assert rows[0]["PercentChange"] == "10.0"
-    assert rows[0]["SummaryMessage"] == "Prices have increased by 10.00%"
\ No newline at end of file
+    assert rows[0]["Mean"] == "210000.0"
+    assert rows[0]["SummaryMessage"] == "Prices have increased by 10.00%"
+
+
+def test_save_to_text_file_reuses_one_append_handle(tmp_path, monkeypatch):
+    monkeypatch.setattr(run, "__file__", str(tmp_path / "run.py"))
+    monkeypatch.setattr(run, "TEXT_EXPORT_FILE", None)
+    stats = run.compute_stats([200000.0, 220000.0])
+
+    first = run.save_to_text_file(stats, "First", 2024, 1, 2024, 2, "Dublin")
+    handle = run.TEXT_EXPORT_FILE
+    run.save_to_text_file(stats, "Second", 2024, 1, 2024, 2, "Cork")
+
+    assert run.TEXT_EXPORT_FILE is handle
+    text = first.read_text(encoding="utf-8")
+    assert "First" in text and "Second" in text
+    assert "210,000.00" in text
+
+    run.close_text_export_file()
+    assert run.TEXT_EXPORT_FILE is None
+
+
+def test_cached_token_round_trips_while_fresh(tmp_path):
+    cache_path = tmp_path / "cache" / "token.json"
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    expiry = now + timedelta(minutes=30)
+    key_id = run.token_cache_key("abc123")
+
+    run.save_cached_token(cache_path, key_id, "token-value", expiry)
+
+    assert oct(cache_path.stat().st_mode & 0o777) == "0o600"
+    assert run.load_cached_token(cache_path, key_id, now=now) == ("token-value", expiry)
+
+
+def test_cached_token_is_ignored_near_expiry_or_for_other_key(tmp_path):
+    cache_path = tmp_path / "token.json"
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    key_id = run.token_cache_key("abc123")
+
+    run.save_cached_token(cache_path, key_id, "token-value", now + timedelta(seconds=30))
+    assert run.load_cached_token(cache_path, key_id, now=now) is None
+
+    run.save_cached_token(cache_path, key_id, "token-value", now + timedelta(minutes=30))
+    assert run.load_cached_token(cache_path, run.token_cache_key("rotated"), now=now) is None
+
+
+def test_worksheet_from_metadata_builds_first_tab_without_requests():
+    class NoRequestClient:
+        def request(self, *args, **kwargs):
+            raise AssertionError("no HTTP request expected")
+
+    metadata = {
+        "spreadsheetId": "sheet-id",
+        "properties": {"title": "Property Prices"},
+        "sheets": [
+            {"properties": {"sheetId": 0, "title": "Sheet1", "index": 0}},
+            {"properties": {"sheetId": 7, "title": "Notes", "index": 1}},
+        ],
+    }
+
+    worksheet = run.worksheet_from_metadata(NoRequestClient(), metadata)
+
+    assert worksheet.title == "Sheet1"
+    assert worksheet.spreadsheet.id == "sheet-id"
+    assert worksheet.spreadsheet.title == "Property Prices"
+
+
+def test_pinned_worksheet_loads_records_without_grid_properties(monkeypatch):
+    class ValuesClient:
+        def __init__(self):
+            self.urls = []
+
+        def request(self, method, url, params=None, **kwargs):
+            self.urls.append(url)
+            body = {
+                "range": "Prices!A1:C2",
+                "majorDimension": "ROWS",
+                "values": [["Year", "Quarter", "Cork"], ["2024", "1", "€300,000"]],
+            }
+            return type("Response", (), {"json": lambda self: body})()
+
+    monkeypatch.setenv("PT_WORKSHEET_TITLE", "Prices")
+    monkeypatch.delenv("PT_WORKSHEET_GID", raising=False)
+    monkeypatch.setattr(run, "RECORDS_CACHE", None)
+    client = ValuesClient()
+    metadata = {
+        "spreadsheetId": "sheet-id",
+        "properties": {},
+        "sheets": [{"properties": run.get_pinned_tab()}],
+    }
+    worksheet = run.worksheet_from_metadata(client, metadata)
+
+    assert run.get_records(worksheet) == [{"Year": "2024", "Quarter": "1", "Cork": "€300,000"}]
+    assert len(client.urls) == 1
+
+
+def test_get_pinned_tab_rejects_non_numeric_gid(monkeypatch):
+    monkeypatch.delenv("PT_WORKSHEET_TITLE", raising=False)
+    monkeypatch.setenv("PT_WORKSHEET_GID", "first")
+
+    with pytest.raises(ValueError, match="PT_WORKSHEET_GID must be a number"):
+        run.get_pinned_tab()
+
+    monkeypatch.setenv("PT_WORKSHEET_GID", "7")
+    assert run.get_pinned_tab() == {"sheetId": 7, "title": "Sheet1", "index": 0}
+
+
+def test_get_creds_path_prefers_env_without_home_lookup(monkeypatch):
+    def fail_home():
+        raise AssertionError("home directory should not be looked up")
+
+    monkeypatch.setenv("PT_CREDS_PATH", "/tmp/creds.json")
+    monkeypatch.setattr(run.Path, "home", fail_home)
+
+    assert run.get_creds_path() == run.Path("/tmp/creds.json")
+
+
+def test_load_service_account_info_explains_missing_file(tmp_path):
+    missing = tmp_path / "missing.json"
+
+    with pytest.raises(FileNotFoundError, match="PT_CREDS_PATH"):
+        run.load_service_account_info(missing)
+
+
+def test_validate_config_rejects_placeholder_id_without_network(tmp_path, monkeypatch):
+    creds_path = tmp_path / "creds.json"
+    creds_path.write_text('{"client_email": "bot@example.com"}', encoding="utf-8")
+    monkeypatch.setenv("PT_CREDS_PATH", str(creds_path))
+    monkeypatch.setenv("PT_SPREADSHEET_ID", "YOUR_SHEET_ID")
+
+    with pytest.raises(ValueError, match="placeholder"):
+        run.validate_config()
+
+    monkeypatch.setenv("PT_SPREADSHEET_ID", "real-id")
+    info, spreadsheet_id = run.validate_config()
+    assert info["client_email"] == "bot@example.com"
+    assert spreadsheet_id == "real-id"
+
+
+def test_cached_signer_round_trips_only_for_same_key(tmp_path):
+    cache_path = tmp_path / "signer.pkl"
+    key_id = run.token_cache_key("abc123")
+
+    run.save_cached_signer(cache_path, key_id, {"stand-in": "signer"})
+
+    assert run.load_cached_signer(cache_path, key_id) == {"stand-in": "signer"}
+    assert run.load_cached_signer(cache_path, run.token_cache_key("rotated")) is None
+
+    cache_path.chmod(0o644)
+    assert run.load_cached_signer(cache_path, key_id) is None
+
+    # Re-saving tightens the existing file so the cache is usable again
+    run.save_cached_signer(cache_path, key_id, {"stand-in": "signer"})
+    assert oct(cache_path.stat().st_mode & 0o777) == "0o600"
+    assert run.load_cached_signer(cache_path, key_id) == {"stand-in": "signer"}
+
+
+def test_run_concurrently_returns_results_in_call_order():
+    # Both calls must be running at once to get past the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    def export(name, suffix):
+        barrier.wait()
+        return f"{name}.{suffix}"
+
+    assert run.run_concurrently(
+        (export, "analysis_results", "txt"),
+        (export, "analysis", "csv"),
+    ) == ["analysis_results.txt", "analysis.csv"]
+
+
+def test_start_in_background_returns_result_or_raises():
+    assert run.start_in_background(lambda: "connected").result(timeout=5) == "connected"
+
+    def fail():
+        raise FileNotFoundError("missing creds")
+
+    with pytest.raises(FileNotFoundError, match="missing creds"):
+        run.start_in_background(fail).result(timeout=5)
+
+
+def test_build_columns_parses_currency_and_marks_blank_or_malformed_cells():
+    records = [
+        {"Year": 2024, "Quarter": 1, "Dublin": "€400,000"},
+        {"Year": 2024, "Quarter": 2, "Dublin": ""},
+        {"Year": 2024, "Quarter": 3, "Dublin": 410000},
+        {"Year": 2024, "Quarter": 4, "Dublin": "€ 415,500 "},
+        {"Year": 2025, "Quarter": 1, "Dublin": "n/a"},
+    ]
+
+    columns = run.build_columns(records)
+    prices = columns["Dublin"]
+
+    assert columns["Year"].tolist() == [2024, 2024, 2024, 2024, 2025]
+    assert columns["Quarter"].tolist() == [1, 2, 3, 4, 1]
+    assert prices[0] == 400000.0
+    assert prices[1] != prices[1]  # NaN
+    assert prices[2] == 410000.0
+    assert prices[3] == 415500.0
+    assert prices[4] != prices[4]  # malformed cell treated as blank
+
+
+def test_build_columns_sorts_by_period_and_price_at_finds_endpoints():
+    records = [
+        {"Year": 2024, "Quarter": 2, "Cork": 320000},
+        {"Year": 2023, "Quarter": 4, "Cork": 300000},
+        {"Year": 2024, "Quarter": 1, "Cork": ""},
+    ]
+
+    columns = run.build_columns(records)
+    periods, prices = columns["Period"], columns["Cork"]
+
+    assert periods.tolist() == [20234, 20241, 20242]
+    assert run.price_at(periods, prices, 20234) == 300000.0
+    assert run.price_at(periods, prices, 20242) == 320000.0
+    assert run.price_at(periods, prices, 20241) is None
+    assert run.price_at(periods, prices, 20243) is None
+
+
+def test_select_period_range_skips_blanks_and_finds_endpoints():
+    columns = run.build_columns(
+        [
+            {"Year": 2023, "Quarter": 3, "Galway": 280000},
+            {"Year": 2023, "Quarter": 4, "Galway": 290000},
+            {"Year": 2024, "Quarter": 1, "Galway": ""},
+            {"Year": 2024, "Quarter": 2, "Galway": 310000},
+        ]
+    )
+
+    data_rows, data_values, start_price, end_price = run.select_period_range(
+        columns, "Galway", run.period_key(2023, 4), run.period_key(2024, 2)
+    )
+
+    assert data_values == [290000.0, 310000.0]
+    assert data_rows[-1] == {"Year": 2024, "Quarter": 2, "Price": 310000.0}
+    assert (start_price, end_price) == (290000.0, 310000.0)
+
+
+def test_select_period_range_reversed_window_has_no_endpoints():
+    columns = run.build_columns(
+        [
+            {"Year": 2024, "Quarter": 1, "Cork": 1001},
+            {"Year": 2024, "Quarter": 2, "Cork": 1002},
+            {"Year": 2024, "Quarter": 3, "Cork": 1003},
+        ]
+    )
+
+    assert run.select_period_range(
+        columns, "Cork", run.period_key(2024, 3), run.period_key(2024, 1)
+    ) == ([], [], None, None)